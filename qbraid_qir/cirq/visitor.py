@@ -8,6 +8,8 @@
 #
 # THERE IS NO WARRANTY for qbraid-qir, as per Section 15 of the GPL v3.
 
+# pylint: disable=too-many-instance-attributes
+
 """
 Module defining CirqVisitor.
 
@@ -28,6 +30,8 @@ logger = logging.getLogger(__name__)
 
 
 class CircuitElementVisitor(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def visit_register(self, qids):
         pass
@@ -47,8 +51,26 @@ class BasicCirqVisitor(CircuitElementVisitor):
         record_output (bool): If True, output of the circuit will be recorded. Defaults to True.
     """
 
+    __slots__ = (
+        "_module",
+        "_context",
+        "_qubit_refs",
+        "_result_refs",
+        "_nullptr",
+        "_builder",
+        "_entry_point",
+        "_qubit_labels",
+        "_measured_qubits",
+        "_initialize_runtime",
+        "_record_output",
+    )
+
     def __init__(self, initialize_runtime: bool = True, record_output: bool = True):
         self._module: pyqir.Module
+        self._context: pyqir.Context
+        self._qubit_refs: list[pyqir.Constant] = []
+        self._result_refs: list[pyqir.Constant] = []
+        self._nullptr: pyqir.Constant
         self._builder: pyqir.Builder
         self._entry_point: str
         self._qubit_labels: dict[cirq.Qid, int] = {}
@@ -59,17 +81,19 @@ class BasicCirqVisitor(CircuitElementVisitor):
     def visit_cirq_module(self, module: CirqModule) -> None:
         logger.debug("Visiting Cirq module '%s' (%d)", module.name, module.num_qubits)
         self._module = module.module
-        context = self._module.context
+        self._context = self._module.context
+        context = self._context
         entry = pyqir.entry_point(self._module, module.name, module.num_qubits, module.num_clbits)
 
         self._entry_point = entry.name
+        self._qubit_refs = [pyqir.qubit(context, i) for i in range(module.num_qubits)]
+        self._result_refs = [pyqir.result(context, i) for i in range(module.num_clbits)]
         self._builder = Builder(context)
         self._builder.insert_at_end(BasicBlock(context, "entry", entry))
+        self._nullptr = Constant.null(PointerType(IntType(context, 8)))
 
         if self._initialize_runtime is True:
-            i8p = PointerType(IntType(context, 8))
-            nullptr = Constant.null(i8p)
-            pyqir.rt.initialize(self._builder, nullptr)
+            pyqir.rt.initialize(self._builder, self._nullptr)
 
     @property
     def entry_point(self) -> str:
@@ -82,38 +106,30 @@ class BasicCirqVisitor(CircuitElementVisitor):
         if self._record_output is False:
             return
 
-        i8p = PointerType(IntType(self._module.context, 8))
-
-        for i in range(module.num_qubits):
-            result_ref = pyqir.result(self._module.context, i)
-            pyqir.rt.result_record_output(self._builder, result_ref, Constant.null(i8p))
+        builder, nullptr = self._builder, self._nullptr
+        result_record_output = pyqir.rt.result_record_output
+        for result_ref in self._result_refs[: module.num_qubits]:
+            result_record_output(builder, result_ref, nullptr)
 
     def visit_register(self, qids: list[cirq.Qid]) -> None:
-        logger.debug("Visiting qids '%s'", str(qids))
+        logger.debug("Visiting qids '%s'", qids)
 
         if not all(isinstance(x, cirq.Qid) for x in qids):
             raise TypeError("All elements in the list must be of type cirq.Qid.")
 
         self._qubit_labels.update({bit: n + len(self._qubit_labels) for n, bit in enumerate(qids)})
-        logger.debug("Added labels for qubits %s", str(qids))
+        logger.debug("Added labels for qubits %s", qids)
 
     def visit_operation(self, operation: cirq.Operation) -> None:
         qlabels = [self._qubit_labels[bit] for bit in operation.qubits]
 
-        qubits = [pyqir.qubit(self._module.context, n) for n in qlabels]
-        results = [pyqir.result(self._module.context, n) for n in qlabels]
-
-        def handle_measurement(pyqir_func):
-            logger.debug("Visiting measurement operation '%s'", str(operation))
-            for qubit, result in zip(qubits, results):
-                self._measured_qubits[pyqir.qubit_id(qubit)] = True
-                pyqir_func(self._builder, qubit, result)
+        qubits = [self._qubit_refs[n] for n in qlabels]
 
         # dealing with conditional gates
         if isinstance(operation, cirq.ClassicallyControlledOperation):
             op_conds = operation._conditions  # list of measurement keys
             conditions = [
-                pyqir.result(self._module.context, int(op_conds[i].keys[0].name))
+                pyqir.result(self._context, int(op_conds[i].keys[0].name))
                 for i in range(len(op_conds))
             ]
             regular_op = operation.without_classical_controls()
@@ -146,7 +162,11 @@ class BasicCirqVisitor(CircuitElementVisitor):
             pyqir_func, op_str = map_cirq_op_to_pyqir_callable(operation)
 
             if op_str.startswith("measure"):
-                handle_measurement(pyqir_func)
+                logger.debug("Visiting measurement operation '%s'", operation)
+                # each qubit is measured into the result with the same label
+                for n in qlabels:
+                    self._measured_qubits[n] = True
+                    pyqir_func(self._builder, self._qubit_refs[n], self._result_refs[n])
             elif op_str in ["Rx", "Ry", "Rz"]:
                 pyqir_func(self._builder, operation.gate._rads, *qubits)  # type: ignore[union-attr]
             else:
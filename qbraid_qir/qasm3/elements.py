@@ -71,8 +71,6 @@ class QasmQIRModule:
 
     def accept(self, visitor):
         visitor.visit_qasm3_module(self)
-        statements = self.qasm_program.unrolled_ast.statements
-        for statement in statements:
-            visitor.visit_statement(statement)
+        visitor.visit_statements(self.qasm_program.unrolled_ast.statements)
         visitor.record_output(self)
         visitor.finalize()
@@ -15,7 +15,8 @@ Module defining Qasm3 Visitor.
 
 """
 import logging
-from typing import Any, Union
+from functools import partial
+from typing import Any, Callable, Union
 
 import openqasm3.ast as qasm3_ast
 import pyqir
@@ -30,6 +31,10 @@ from .maps import map_qasm_op_to_pyqir_callable
 logger = logging.getLogger(__name__)
 
 
+def _noop() -> None:
+    """Branch callback used for an empty if / else block."""
+
+
 class QasmQIRVisitor:
     """A visitor for converting OpenQASM 3 programs to QIR.
 
@@ -43,6 +48,28 @@ class QasmQIRVisitor:
                                     qir-functions with the name "__quantum__qis__<GateName>__body"
     """
 
+    __slots__ = (
+        "_llvm_module",
+        "_builder",
+        "_context",
+        "_entry_point",
+        "_qreg_base",
+        "_creg_base",
+        "_qubit_refs",
+        "_result_refs",
+        "_nullptr",
+        "_total_qubits",
+        "_total_clbits",
+        "_custom_gates",
+        "_basic_op_cache",
+        "_barrier_qubits",
+        "_initialize_runtime",
+        "_record_output",
+        "_external_gates_map",
+        "_branch_params_map",
+        "_visit_map",
+    )
+
     def __init__(
         self,
         initialize_runtime: bool = True,
@@ -51,13 +78,19 @@ class QasmQIRVisitor:
     ):
         self._llvm_module: pyqir.Module
         self._builder: pyqir.Builder
+        self._context: pyqir.Context
         self._entry_point: str = ""
-        self._qubit_labels: dict[str, int] = {}
-        self._clbit_labels: dict[str, int] = {}
-        self._global_qreg_size_map: dict[str, int] = {}
-        self._global_creg_size_map: dict[str, int] = {}
+        self._qreg_base: dict[str, int] = {}
+        self._creg_base: dict[str, int] = {}
+        self._qubit_refs: list[pyqir.Constant] = []
+        self._result_refs: list[pyqir.Constant] = []
+        self._nullptr: pyqir.Constant
+        self._total_qubits: int = 0
+        self._total_clbits: int = 0
         self._custom_gates: dict[str, qasm3_ast.QuantumGateDefinition] = {}
-        self._barrier_qubits: set[pyqir.Constant] = set()
+        self._basic_op_cache: dict[str, tuple[Callable, int]] = {}
+        # bitset of the qubits covered by the pending barrier, bit i is global qubit i
+        self._barrier_qubits: int = 0
         self._initialize_runtime: bool = initialize_runtime
         self._record_output: bool = record_output
 
@@ -66,6 +99,22 @@ class QasmQIRVisitor:
         self._external_gates_map: dict[str, pyqir.Function | None] = {
             external_gate: None for external_gate in external_gates
         }
+        self._branch_params_map: dict[type, Callable[[Any], tuple[str, int, bool]]] = {
+            qasm3_ast.UnaryExpression: self._get_unary_branch_params,
+            qasm3_ast.BinaryExpression: self._get_binary_branch_params,
+            qasm3_ast.IndexExpression: self._get_index_branch_params,
+        }
+        self._visit_map: dict[type, Callable[[Any], None]] = {
+            qasm3_ast.Include: lambda x: None,  # No operation
+            qasm3_ast.QubitDeclaration: self._visit_register,
+            qasm3_ast.ClassicalDeclaration: self._visit_register,
+            qasm3_ast.QuantumMeasurementStatement: self._visit_measurement,
+            qasm3_ast.QuantumReset: self._visit_reset,
+            qasm3_ast.QuantumBarrier: self._visit_barrier,
+            qasm3_ast.QuantumGate: self._visit_generic_gate_operation,
+            qasm3_ast.BranchingStatement: self._visit_branching_statement,
+            qasm3_ast.QuantumPhase: lambda x: None,  # No operation
+        }
 
     def visit_qasm3_module(self, module: QasmQIRModule) -> None:
         """
@@ -80,19 +129,25 @@ class QasmQIRVisitor:
         qasm3_module = module.qasm_program
         logger.debug("Visiting Qasm3 module '%s' (%d)", module.name, qasm3_module.num_qubits)
         self._llvm_module = module.llvm_module
-        context = self._llvm_module.context
+        self._context = self._llvm_module.context
+        context = self._context
         entry = pyqir.entry_point(
             self._llvm_module, module.name, qasm3_module.num_qubits, qasm3_module.num_clbits
         )
 
         self._entry_point = entry.name
+        # the number of bits is fixed by now, so the QIR handles are created only once
+        self._qubit_refs = [pyqir.qubit(context, i) for i in range(qasm3_module.num_qubits)]
+        # record_output reports one result per qubit, which may exceed the clbit count
+        num_results = max(qasm3_module.num_clbits, qasm3_module.num_qubits)
+        self._result_refs = [pyqir.result(context, i) for i in range(num_results)]
         self._builder = pyqir.Builder(context)
         self._builder.insert_at_end(pyqir.BasicBlock(context, "entry", entry))
+        # i8* null, passed to the runtime for both initialization and output labels
+        self._nullptr = pyqir.Constant.null(pyqir.PointerType(pyqir.IntType(context, 8)))
 
         if self._initialize_runtime is True:
-            i8p = pyqir.PointerType(pyqir.IntType(context, 8))
-            nullptr = pyqir.Constant.null(i8p)
-            pyqir.rt.initialize(self._builder, nullptr)
+            pyqir.rt.initialize(self._builder, self._nullptr)
 
     @property
     def entry_point(self) -> str:
@@ -105,10 +160,10 @@ class QasmQIRVisitor:
     def record_output(self, module: QasmQIRModule) -> None:
         if self._record_output is False:
             return
-        i8p = pyqir.PointerType(pyqir.IntType(self._llvm_module.context, 8))
-        for i in range(module.qasm_program.num_qubits):
-            result_ref = pyqir.result(self._llvm_module.context, i)
-            pyqir.rt.result_record_output(self._builder, result_ref, pyqir.Constant.null(i8p))
+        builder, nullptr = self._builder, self._nullptr
+        result_record_output = pyqir.rt.result_record_output
+        for result_ref in self._result_refs[: module.qasm_program.num_qubits]:
+            result_record_output(builder, result_ref, nullptr)
 
     def _visit_register(
         self, register: Union[qasm3_ast.QubitDeclaration, qasm3_ast.ClassicalDeclaration]
@@ -121,10 +176,9 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        logger.debug("Visiting register '%s'", str(register))
+        logger.debug("Visiting register '%s'", register)
         is_qubit = isinstance(register, qasm3_ast.QubitDeclaration)
 
-        current_size = len(self._qubit_labels) if is_qubit else len(self._clbit_labels)
         if is_qubit:
             register_size = (
                 1 if register.size is None else register.size.value  # type: ignore[union-attr]
@@ -141,37 +195,39 @@ class QasmQIRVisitor:
             else register.identifier.name  # type: ignore[union-attr]
         )
 
-        size_map = self._global_qreg_size_map if is_qubit else self._global_creg_size_map
-        label_map = self._qubit_labels if is_qubit else self._clbit_labels
+        # bit i of the register is global bit base + i
+        if is_qubit:
+            self._qreg_base[register_name] = self._total_qubits
+            self._total_qubits += register_size
+        else:
+            self._creg_base[register_name] = self._total_clbits
+            self._total_clbits += register_size
 
-        for i in range(register_size):
-            size_map[f"{register_name}"] = register_size
-            label_map[f"{register_name}_{i}"] = current_size + i
+        logger.debug("Added base offset for register '%s'", register)
 
-        logger.debug("Added labels for register '%s'", str(register))
-
-    def _get_op_bits(self, operation: Any, qubits: bool = True) -> list[pyqir.Constant]:
-        """Get the quantum / classical bits for the operation.
+    def _get_op_bit_ids(self, operation: Any, qubits: bool = True) -> list[int]:
+        """Get the global indices of the quantum / classical bits for the operation.
 
         Args:
             operation (Any): The operation to get qubits for.
-            reg_size_map (dict): The size map of the registers in scope.
             qubits (bool): Whether the bits are quantum bits or classical bits. Defaults to True.
 
         Returns:
-            Unionlist[pyqir.Constant] : The bits for the operation.
+            list[int] : The global bit indices for the operation.
         """
-        qir_bits = []
-        bit_list = []
         if isinstance(operation, qasm3_ast.QuantumMeasurementStatement):
             assert operation.target is not None
             bit_list = [operation.measure.qubit] if qubits else [operation.target]
         else:
-            bit_list = (
-                operation.qubits if isinstance(operation.qubits, list) else [operation.qubits]
-            )
+            bit_list = operation.qubits
+            if not isinstance(bit_list, list):
+                bit_list = [bit_list]
+
+        # each bit maps to a single register index, so the result size is known up-front
+        bit_ids: list[int] = [0] * len(bit_list)
+        base_map = self._qreg_base if qubits else self._creg_base
 
-        for bit in bit_list:
+        for i, bit in enumerate(bit_list):
             # as we have unrolled qasm3, we can assume that the bit is an IndexedIdentifier
             assert isinstance(bit, qasm3_ast.IndexedIdentifier)
             reg_name = bit.name.name
@@ -179,24 +235,23 @@ class QasmQIRVisitor:
             assert isinstance(bit.indices, list) and len(bit.indices) == 1
             assert isinstance(bit.indices[0], list) and len(bit.indices[0]) == 1
             assert isinstance(bit.indices[0][0], qasm3_ast.IntegerLiteral)
-            bit_id = bit.indices[0][0].value
-            bit_ids = [bit_id]
-
-            label_map = self._qubit_labels if qubits else self._clbit_labels
-            reg_ids = [label_map[f"{reg_name}_{bit_id}"] for bit_id in bit_ids]
-
-            qir_bits.extend(
-                [
-                    (
-                        pyqir.qubit(self._llvm_module.context, bit_id)
-                        if qubits
-                        else pyqir.result(self._llvm_module.context, bit_id)
-                    )
-                    for bit_id in reg_ids
-                ]
-            )
 
-        return qir_bits
+            bit_ids[i] = base_map[reg_name] + bit.indices[0][0].value
+
+        return bit_ids
+
+    def _get_op_bits(self, operation: Any, qubits: bool = True) -> list[pyqir.Constant]:
+        """Get the quantum / classical bits for the operation.
+
+        Args:
+            operation (Any): The operation to get qubits for.
+            qubits (bool): Whether the bits are quantum bits or classical bits. Defaults to True.
+
+        Returns:
+            list[pyqir.Constant] : The bits for the operation.
+        """
+        bit_refs = self._qubit_refs if qubits else self._result_refs
+        return [bit_refs[bit_id] for bit_id in self._get_op_bit_ids(operation, qubits)]
 
     def _visit_measurement(self, statement: qasm3_ast.QuantumMeasurementStatement) -> None:
         """Visit a measurement statement element.
@@ -207,15 +262,20 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        logger.debug("Visiting measurement statement '%s'", str(statement))
+        logger.debug("Visiting measurement statement '%s'", statement)
 
         source = statement.measure.qubit
         target = statement.target
         assert source and target
-        source_ids = self._get_op_bits(statement, qubits=True)
-        target_ids = self._get_op_bits(statement, qubits=False)
+        source_ids = self._get_op_bit_ids(statement, qubits=True)
+        target_ids = self._get_op_bit_ids(statement, qubits=False)
+
+        mz = pyqir._native.mz
+        builder = self._builder
+        qubit_refs = self._qubit_refs
+        result_refs = self._result_refs
         for src_id, tgt_id in zip(source_ids, target_ids):
-            pyqir._native.mz(self._builder, src_id, tgt_id)  # type: ignore[arg-type]
+            mz(builder, qubit_refs[src_id], result_refs[tgt_id])  # type: ignore[arg-type]
 
     def _visit_reset(self, statement: qasm3_ast.QuantumReset) -> None:
         """Visit a reset statement element.
@@ -226,12 +286,14 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        logger.debug("Visiting reset statement '%s'", str(statement))
+        logger.debug("Visiting reset statement '%s'", statement)
         qubit_ids = self._get_op_bits(statement, True)
+        builder = self._builder
+        reset = pyqir._native.reset
 
         for qid in qubit_ids:
             # qid is of type Constant which is inherited from Value, so we ignore the type error
-            pyqir._native.reset(self._builder, qid)  # type: ignore[arg-type]
+            reset(builder, qid)  # type: ignore[arg-type]
 
     def _barrier_applicable(self) -> bool:
         """Check if the barrier operation is applicable.
@@ -242,8 +304,7 @@ class QasmQIRVisitor:
         Returns:
             bool: Whether the barrier operation is applicable.
         """
-        total_qubit_count = sum(self._global_qreg_size_map.values())
-        return len(self._barrier_qubits) == total_qubit_count
+        return self._barrier_qubits == (1 << self._total_qubits) - 1
 
     def _check_and_apply_barrier(self) -> None:
         """Apply the barrier operation.
@@ -251,12 +312,12 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        if len(self._barrier_qubits) == 0:
+        if self._barrier_qubits == 0:
             return
 
         if self._barrier_applicable():
             pyqir._native.barrier(self._builder)
-            self._barrier_qubits.clear()
+            self._barrier_qubits = 0
         else:
             raise_qasm3_error(
                 "Barrier operation on a qubit subset is not supported in pyqir",
@@ -272,13 +333,13 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        barrier_qubit = self._get_op_bits(barrier, qubits=True)
-        self._barrier_qubits.update(barrier_qubit)
+        for qubit_id in self._get_op_bit_ids(barrier, qubits=True):
+            self._barrier_qubits |= 1 << qubit_id
 
         # try to apply barrier in case all qubits are covered here itself
         if self._barrier_applicable():
             pyqir._native.barrier(self._builder)
-            self._barrier_qubits.clear()
+            self._barrier_qubits = 0
 
     def _get_op_parameters(self, operation: qasm3_ast.QuantumGate) -> list[float]:
         """Get the parameters for the operation.
@@ -289,13 +350,9 @@ class QasmQIRVisitor:
         Returns:
             list[float]: The parameters for the operation.
         """
-        param_list = []
-        for param in operation.arguments:
-            assert hasattr(param, "value")
-            param_value = param.value
-            param_list.append(param_value)
-
-        return param_list
+        # arguments are folded to literals during unrolling
+        assert all(hasattr(param, "value") for param in operation.arguments)
+        return [param.value for param in operation.arguments]  # type: ignore[attr-defined]
 
     def _visit_basic_gate_operation(self, operation: qasm3_ast.QuantumGate) -> None:
         """Visit a gate operation element.
@@ -312,22 +369,27 @@ class QasmQIRVisitor:
 
         """
 
-        logger.debug("Visiting basic gate operation '%s'", str(operation))
+        logger.debug("Visiting basic gate operation '%s'", operation)
         op_name: str = operation.name.name
         op_qubits = self._get_op_bits(operation)
-        qir_func, op_qubit_count = map_qasm_op_to_pyqir_callable(op_name)
-        op_parameters = None
-
-        if len(operation.arguments) > 0:  # parametric gate
-            op_parameters = self._get_op_parameters(operation)
+        try:
+            qir_func, op_qubit_count = self._basic_op_cache[op_name]
+        except KeyError:
+            qir_func, op_qubit_count = map_qasm_op_to_pyqir_callable(op_name)
+            self._basic_op_cache[op_name] = (qir_func, op_qubit_count)
+        # non-parametric gates get an empty list, so every call site is the same splat
+        op_parameters = self._get_op_parameters(operation)
+
+        if len(op_qubits) == op_qubit_count:
+            # unrolled gates act on a single qubit subset, so no slicing is needed
+            qir_func(self._builder, *op_parameters, *op_qubits)
+            return
 
+        builder = self._builder
         for i in range(0, len(op_qubits), op_qubit_count):
             # we apply the gate on the qubit subset linearly
             qubit_subset = op_qubits[i : i + op_qubit_count]
-            if op_parameters is not None:
-                qir_func(self._builder, *op_parameters, *qubit_subset)
-            else:
-                qir_func(self._builder, *qubit_subset)
+            qir_func(builder, *op_parameters, *qubit_subset)
 
     def _visit_external_gate_operation(self, operation: qasm3_ast.QuantumGate) -> None:
         """Visit an external gate operation element.
@@ -343,18 +405,18 @@ class QasmQIRVisitor:
             Qasm3ConversionError: If the number of qubits is invalid.
 
         """
-        logger.debug("Visiting external gate operation '%s'", str(operation))
+        logger.debug("Visiting external gate operation '%s'", operation)
         op_name: str = operation.name.name
         op_qubits = self._get_op_bits(operation)
         op_qubit_count = len(op_qubits)
 
-        if len(operation.modifiers) > 0:
+        if operation.modifiers:
             raise_qasm3_error(
                 "Modifiers on externally linked gates are not supported in pyqir",
                 err_type=NotImplementedError,
             )
 
-        context = self._llvm_module.context
+        context = self._context
         qir_function = self._external_gates_map[op_name]
         if qir_function is None:
             # First time seeing this external gate -> define new function
@@ -392,6 +454,75 @@ class QasmQIRVisitor:
         else:
             self._visit_basic_gate_operation(operation)
 
+    @staticmethod
+    def _validate_index_expression(expression: Any) -> None:
+        """Validate that an expression indexes a single bit of a classical register.
+
+        Args:
+            expression (Any): The expression to validate.
+
+        Returns:
+            None
+        """
+        assert isinstance(expression, qasm3_ast.IndexExpression)
+        assert isinstance(expression.collection, qasm3_ast.Identifier)
+        assert isinstance(expression.index, list) and len(expression.index) == 1
+        assert isinstance(expression.index[0], qasm3_ast.IntegerLiteral)
+
+    def _get_unary_branch_params(
+        self, condition: qasm3_ast.UnaryExpression
+    ) -> tuple[str, int, bool]:
+        """Get the branch parameters from a unary branching condition, eg. `!c[0]`.
+
+        Args:
+            condition (qasm3_ast.UnaryExpression): The condition to analyze.
+
+        Returns:
+            tuple[str, int, bool]: (register name, register id, positive branch)
+        """
+        expression = condition.expression
+        self._validate_index_expression(expression)
+        return (
+            expression.collection.name,  # type: ignore
+            expression.index[0].value,  # type: ignore
+            condition.op != UnaryOperator["!"],
+        )
+
+    def _get_binary_branch_params(
+        self, condition: qasm3_ast.BinaryExpression
+    ) -> tuple[str, int, bool]:
+        """Get the branch parameters from a binary branching condition, eg. `c[0] == true`.
+
+        Args:
+            condition (qasm3_ast.BinaryExpression): The condition to analyze.
+
+        Returns:
+            tuple[str, int, bool]: (register name, register id, positive branch)
+        """
+        lhs, rhs = condition.lhs, condition.rhs
+        assert isinstance(rhs, qasm3_ast.BooleanLiteral), "Invalid branching condition"
+        self._validate_index_expression(lhs)
+        return (
+            lhs.collection.name,  # type: ignore
+            lhs.index[0].value,  # type: ignore
+            rhs.value,
+        )
+
+    def _get_index_branch_params(
+        self, condition: qasm3_ast.IndexExpression
+    ) -> tuple[str, int, bool]:
+        """Get the branch parameters from an index branching condition, eg. `c[0]`.
+
+        Args:
+            condition (qasm3_ast.IndexExpression): The condition to analyze.
+
+        Returns:
+            tuple[str, int, bool]: (register name, register id, positive branch)
+        """
+        index = condition.index
+        assert isinstance(index, list) and len(index) == 1
+        return (condition.collection.name, index[0].value, True)  # type: ignore
+
     def _get_branch_params(self, condition: Any) -> tuple[str, int, bool]:
         """
         Get the branch parameters from the branching condition
@@ -402,35 +533,11 @@ class QasmQIRVisitor:
         Returns:
             tuple[str, int, bool]: (register name, register id, positive branch)
         """
-
-        def validate_index_expression(expression):
-            assert isinstance(expression, qasm3_ast.IndexExpression)
-            assert isinstance(expression.collection, qasm3_ast.Identifier)
-            assert isinstance(expression.index, list) and len(expression.index) == 1
-            assert isinstance(expression.index[0], qasm3_ast.IntegerLiteral)
-
-        if isinstance(condition, qasm3_ast.UnaryExpression):
-            validate_index_expression(condition.expression)
-            return (
-                condition.expression.collection.name,  # type: ignore
-                condition.expression.index[0].value,  # type: ignore
-                not condition.op == UnaryOperator["!"],
-            )
-        if isinstance(condition, qasm3_ast.BinaryExpression):
-            assert isinstance(
-                condition.rhs, qasm3_ast.BooleanLiteral
-            ), "Invalid branching condition"
-            validate_index_expression(condition.lhs)
-            return (
-                condition.lhs.collection.name,  # type: ignore
-                condition.lhs.index[0].value,  # type: ignore
-                condition.rhs.value,
-            )
-        if isinstance(condition, qasm3_ast.IndexExpression):
-            assert isinstance(condition.index, list) and len(condition.index) == 1
-            return (condition.collection.name, condition.index[0].value, True)  # type: ignore
-        # default case
-        return "", -1, True
+        branch_params_function = self._branch_params_map.get(type(condition))
+        if branch_params_function is None:
+            # default case
+            return "", -1, True
+        return branch_params_function(condition)
 
     def _visit_branching_statement(self, statement: qasm3_ast.BranchingStatement) -> None:
         """Visit a branching statement element.
@@ -442,25 +549,94 @@ class QasmQIRVisitor:
             None
         """
 
-        condition = statement.condition
-
         if_block = statement.if_block
         else_block = statement.else_block
-        reg_name, reg_id, positive_branch = self._get_branch_params(condition)
+        reg_name, reg_id, positive_branch = self._get_branch_params(statement.condition)
+
+        # gates shared by the start / end of both blocks run regardless of the
+        # condition, so they are emitted once around the branch instead of twice
+        prefix_len, suffix_len = self._get_common_block_bounds(if_block, else_block)
+        if_body = if_block[prefix_len : len(if_block) - suffix_len]
+        else_body = else_block[prefix_len : len(else_block) - suffix_len]
+
+        self.visit_statements(if_block[:prefix_len])
+        # nothing depends on the condition, so no branch needs to be emitted
+        if if_body or else_body:
+            visit_if = partial(self.visit_statements, if_body) if if_body else _noop
+            visit_else = partial(self.visit_statements, else_body) if else_body else _noop
+            # a negated condition only swaps which result value runs which block
+            one, zero = (visit_if, visit_else) if positive_branch else (visit_else, visit_if)
+            pyqir._native.if_result(
+                self._builder,
+                self._result_refs[self._creg_base[reg_name] + reg_id],
+                zero=zero,
+                one=one,
+            )
+        self.visit_statements(if_block[len(if_block) - suffix_len :])
 
-        if not positive_branch:
-            if_block, else_block = else_block, if_block
+    def _get_common_block_bounds(
+        self, if_block: list[qasm3_ast.Statement], else_block: list[qasm3_ast.Statement]
+    ) -> tuple[int, int]:
+        """Get the number of identical gates at the start and end of two branch blocks.
 
-        def _visit_statement_block(block):
-            for stmt in block:
-                self.visit_statement(stmt)
+        Args:
+            if_block (list[qasm3_ast.Statement]): The statements of the first block.
+            else_block (list[qasm3_ast.Statement]): The statements of the second block.
 
-        pyqir._native.if_result(
-            self._builder,
-            pyqir.result(self._llvm_module.context, self._clbit_labels[f"{reg_name}_{reg_id}"]),
-            zero=lambda: _visit_statement_block(else_block),
-            one=lambda: _visit_statement_block(if_block),
-        )
+        Returns:
+            tuple[int, int]: (common prefix length, common suffix length)
+        """
+        max_common = min(len(if_block), len(else_block))
+
+        prefix_len = 0
+        while prefix_len < max_common and self._gates_equal(
+            if_block[prefix_len], else_block[prefix_len]
+        ):
+            prefix_len += 1
+
+        suffix_len = 0
+        while suffix_len < max_common - prefix_len and self._gates_equal(
+            if_block[-1 - suffix_len], else_block[-1 - suffix_len]
+        ):
+            suffix_len += 1
+
+        return prefix_len, suffix_len
+
+    def _gates_equal(self, first: qasm3_ast.Statement, second: qasm3_ast.Statement) -> bool:
+        """Check if two statements apply the same unmodified gate to the same qubits.
+
+        Source spans are ignored. Any statement other than a gate call is reported as
+        different, so that measurements, resets and barriers always stay in their block.
+
+        Args:
+            first (qasm3_ast.Statement): The first statement.
+            second (qasm3_ast.Statement): The second statement.
+
+        Returns:
+            bool: Whether both statements emit the same gate call.
+        """
+        if not (
+            isinstance(first, qasm3_ast.QuantumGate) and isinstance(second, qasm3_ast.QuantumGate)
+        ):
+            return False
+        if first.modifiers or second.modifiers or first.name.name != second.name.name:
+            return False
+        if self._get_op_bit_ids(first) != self._get_op_bit_ids(second):
+            return False
+        return self._get_op_parameters(first) == self._get_op_parameters(second)
+
+    def visit_statements(self, statements: list[qasm3_ast.Statement]) -> None:
+        """Visit a sequence of statements in order.
+
+        Args:
+            statements (list[qasm3_ast.Statement]): The statements to visit.
+
+        Returns:
+            None
+        """
+        visit_statement = self.visit_statement
+        for statement in statements:
+            visit_statement(statement)
 
     def visit_statement(self, statement: qasm3_ast.Statement) -> None:
         """Visit a statement element.
@@ -471,30 +647,19 @@ class QasmQIRVisitor:
         Returns:
             None
         """
-        logger.debug("Visiting statement '%s'", str(statement))
-
-        visit_map = {
-            qasm3_ast.Include: lambda x: None,  # No operation
-            qasm3_ast.QubitDeclaration: self._visit_register,
-            qasm3_ast.ClassicalDeclaration: self._visit_register,
-            qasm3_ast.QuantumMeasurementStatement: self._visit_measurement,
-            qasm3_ast.QuantumReset: self._visit_reset,
-            qasm3_ast.QuantumBarrier: self._visit_barrier,
-            qasm3_ast.QuantumGate: self._visit_generic_gate_operation,
-            qasm3_ast.BranchingStatement: self._visit_branching_statement,
-            qasm3_ast.QuantumPhase: lambda x: None,  # No operation
-        }
+        logger.debug("Visiting statement '%s'", statement)
 
-        visitor_function = visit_map.get(type(statement))
+        statement_type = type(statement)
+        visitor_function = self._visit_map.get(statement_type)
 
-        if not isinstance(statement, qasm3_ast.QuantumBarrier):
+        if statement_type is not qasm3_ast.QuantumBarrier:
             self._check_and_apply_barrier()
 
         if visitor_function:
             visitor_function(statement)  # type: ignore[operator]
         else:
             raise_qasm3_error(
-                f"Unsupported statement of type {type(statement)}", span=statement.span
+                f"Unsupported statement of type {statement_type}", span=statement.span
             )
 
     def ir(self) -> str:
@@ -100,3 +100,92 @@ def test_complex_if():
     check_attributes(generated_qir, 4, 8)
     complex_if = resources_file("complex_if.ll")
     compare_reference_ir(result.bitcode, complex_if)
+
+
+def test_if_else_common_gates_lifted():
+    """Test that gates shared by the start and end of both blocks are emitted once."""
+    qasm = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    qubit[2] q;
+    bit[2] c;
+    h q;
+    measure q -> c;
+    if(c[0]){
+        x q[0];
+        h q[1];
+        rz(0.5) q[0];
+    } else {
+        x q[0];
+        y q[1];
+        rz(0.5) q[0];
+    }
+    """
+    result = qasm3_to_qir(qasm)
+    generated_qir = str(result).splitlines()
+
+    check_attributes(generated_qir, 2, 2)
+    entry_body = get_entry_point_body(generated_qir)
+    x_calls = [i for i, line in enumerate(entry_body) if "__quantum__qis__x__body" in line]
+    rz_calls = [i for i, line in enumerate(entry_body) if "__quantum__qis__rz__body" in line]
+    branch = next(i for i, line in enumerate(entry_body) if line.strip().startswith("br i1"))
+    merge = next(i for i, line in enumerate(entry_body) if line.startswith("continue"))
+
+    assert len(x_calls) == 1 and x_calls[0] < branch
+    assert len(rz_calls) == 1 and rz_calls[0] > merge
+    assert any("__quantum__qis__y__body" in line for line in entry_body[branch:merge])
+
+
+def test_if_else_different_gates_not_lifted():
+    """Test that gates differing in qubits or parameters stay inside their blocks."""
+    qasm = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    qubit[2] q;
+    bit[2] c;
+    h q;
+    measure q -> c;
+    if(c[0]){
+        x q[0];
+        rz(0.5) q[0];
+    } else {
+        x q[1];
+        rz(0.25) q[0];
+    }
+    """
+    result = qasm3_to_qir(qasm)
+    generated_qir = str(result).splitlines()
+
+    entry_body = get_entry_point_body(generated_qir)
+    branch = next(i for i, line in enumerate(entry_body) if line.strip().startswith("br i1"))
+    gate_calls = [
+        i
+        for i, line in enumerate(entry_body)
+        if "__quantum__qis__x__body" in line or "__quantum__qis__rz__body" in line
+    ]
+
+    assert len(gate_calls) == 4
+    assert all(i > branch for i in gate_calls)
+
+
+def test_if_else_identical_blocks_no_branch():
+    """Test that no branch is emitted when both blocks are identical."""
+    qasm = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    qubit[1] q;
+    bit[1] c;
+    h q;
+    measure q -> c;
+    if(c[0]){
+        x q[0];
+    } else {
+        x q[0];
+    }
+    """
+    result = qasm3_to_qir(qasm)
+    generated_qir = str(result).splitlines()
+
+    entry_body = get_entry_point_body(generated_qir)
+    assert not any(line.startswith("br ") for line in entry_body)
+    assert sum("__quantum__qis__x__body" in line for line in entry_body) == 1